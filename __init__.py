@@ -10,8 +10,11 @@ from .generator.poker_feedback_generator import PokerFeedbackGenerator
 from .json_schema_validator import JsonSchemaValidator, SchemaValidatorLoader
 from .loader import load_schema
 from .openai_chat_completition_client import (
+    AsyncOpenAIChatCompletionClient,
     BaseContentGenerator,
+    BatchChatCompletionClient,
     ChatCompletionClient,
+    ChatCompletionRequest,
     ContentGeneratorRegistry,
     OpenAIChatCompletionClient,
     PromptBuilder,
@@ -24,6 +27,9 @@ __all__ = [
     "SchemaValidatorLoader",
     "load_schema",
     "OpenAIChatCompletionClient",
+    "AsyncOpenAIChatCompletionClient",
+    "BatchChatCompletionClient",
+    "ChatCompletionRequest",
     "BaseContentGenerator",
     "PromptBuilder",
     "ChatCompletionClient",
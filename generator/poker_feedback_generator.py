@@ -10,12 +10,36 @@ All comments and docstrings use British English spelling.
 """
 
 import os
-from typing import Callable, Optional
+from functools import lru_cache
+from typing import Callable, Iterator, Optional, Protocol
 
 from openai.types.chat import ChatCompletionMessageParam
 
+from ..json_schema_validator import JsonSchemaValidator
 from ..openai_chat_completition_client import BaseContentGenerator, ChatCompletionClient, PromptBuilder
-from ..prompt_builder import PokerFeedbackPromptBuilder, PokerStats
+from ..prompt_builder import POKER_STATS_SCHEMA, PokerFeedbackPromptBuilder, PokerStats
+
+# The system message never changes between requests; build it once and share it.
+_SYSTEM_MSG: ChatCompletionMessageParam = {
+    "role": "system",
+    "content": (
+        "You are an expert poker coach. Follow the instructions strictly. "
+        "Answer with plain text only (no emojis, no markdown)."
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_schema_validator() -> JsonSchemaValidator:
+    """Return the `POKER_STATS_SCHEMA` validator, compiled once and shared by all generators."""
+    return JsonSchemaValidator(POKER_STATS_SCHEMA)
+
+
+class LengthLimitedPromptBuilder(PromptBuilder, Protocol):
+    """Prompt builder that also declares the maximum output length it asks for."""
+
+    @property
+    def max_chars(self) -> int: ...
 
 
 class PokerFeedbackGenerator(BaseContentGenerator):
@@ -24,30 +48,29 @@ class PokerFeedbackGenerator(BaseContentGenerator):
     The generator uses dependency injection for the chat completion client and a builder
     factory to prepare per-request prompts. The output is trimmed to the maximum number of
     characters requested by the builder to ensure suitability for mobile and web UIs.
+    `schema_validator` is the shared `POKER_STATS_SCHEMA` validator, e.g. for untrusted input.
     """
 
-    builder_factory: Callable[[PokerStats], PromptBuilder]
+    builder_factory: Callable[[PokerStats], LengthLimitedPromptBuilder]
 
     def __init__(
         self,
         *,
         chat_completion_client: ChatCompletionClient,
         model_name: str | None = None,
-        builder_factory: Callable[[PokerStats], PromptBuilder] | None = None,
+        builder_factory: Callable[[PokerStats], LengthLimitedPromptBuilder] | None = None,
     ) -> None:
         # Fallbacks are environmental to keep configuration outside code.
         resolved_model = model_name or os.environ.get("POKER_FEEDBACK_MODEL", "gpt-5")
-        # Provide a harmless default builder instance for the base class; real builders are
-        # produced per-call by `builder_factory`.
-        default_stats: PokerStats = {}
-        default_builder = (builder_factory or (lambda s: PokerFeedbackPromptBuilder(s)))(default_stats)
+        # Builders are produced per-call by `builder_factory`, so the base class gets none.
+        # The validator is compiled by the first generator only; later ones reuse it.
         super().__init__(
-            prompt_builder=default_builder,
+            prompt_builder=None,
             chat_completion_client=chat_completion_client,
-            schema_validator=None,
+            schema_validator=_get_schema_validator(),
             model_name=resolved_model,
         )
-        self.builder_factory = builder_factory or (lambda s: PokerFeedbackPromptBuilder(s))
+        self.builder_factory = builder_factory or PokerFeedbackPromptBuilder
 
     def generate(
         self,
@@ -63,28 +86,73 @@ class PokerFeedbackGenerator(BaseContentGenerator):
         requested by the builder to guarantee UI constraints.
         """
         builder = self.builder_factory(stats)
-        prompt = builder.build()
-
-        system_msg: ChatCompletionMessageParam = {
-            "role": "system",
-            "content": (
-                "You are an expert poker coach. Follow the instructions strictly. "
-                "Answer with plain text only (no emojis, no markdown)."
-            ),
-        }
-        user_msg: ChatCompletionMessageParam = {"role": "user", "content": prompt}
-        messages: list[ChatCompletionMessageParam] = [system_msg, user_msg]
 
         content = self.chat_completion_client.create(
             model_name=self.model_name,
-            messages=messages,
+            messages=self._messages(builder.build()),
             max_tokens=max_tokens,
             top_p=top_p,
         )
 
         text = (content or "").strip()
         # Enforce the max character length contract to protect downstream UIs.
-        max_chars = getattr(builder, "max_chars", 280)
+        max_chars = builder.max_chars
         if len(text) <= max_chars:
             return text
-        return text[:max_chars].rstrip()
+        trimmed = text[:max_chars]
+        # Only strip when the cut lands on whitespace; otherwise avoid a second copy.
+        return trimmed.rstrip() if trimmed and trimmed[-1].isspace() else trimmed
+
+    def generate_stream(
+        self,
+        stats: PokerStats,
+        *,
+        top_p: float = 0.9,
+        max_tokens: Optional[int] = 120,
+    ) -> Iterator[str]:
+        """Yield feedback fragments for the given statistics as the model produces them.
+
+        The concatenated output equals what `generate` returns for the same model output:
+        surrounding whitespace is stripped (trailing whitespace is held back until more text
+        follows) and the text stops at the builder's max character limit. The upstream
+        stream is closed as soon as the limit is reached.
+        """
+        builder = self.builder_factory(stats)
+        max_chars = builder.max_chars
+        stream = self.chat_completion_client.create_stream(
+            model_name=self.model_name,
+            messages=self._messages(builder.build()),
+            max_tokens=max_tokens,
+            top_p=top_p,
+        )
+
+        emitted = 0
+        pending = ""  # Whitespace held back until it is followed by more text.
+        try:
+            for piece in stream:
+                text = pending + piece
+                if not emitted:
+                    text = text.lstrip()
+                body = text.rstrip()
+                pending = text[len(body) :]
+                if not body:
+                    continue
+                remaining = max_chars - emitted
+                if len(body) >= remaining:
+                    # Same trimming as `generate`: cut at the limit, then drop trailing spaces.
+                    cut = body[:remaining].rstrip()
+                    if cut:
+                        yield cut
+                    break
+                emitted += len(body)
+                yield body
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _messages(prompt: str) -> list[ChatCompletionMessageParam]:
+        """Return the system + user message pair for a prompt."""
+        user_msg: ChatCompletionMessageParam = {"role": "user", "content": prompt}
+        return [_SYSTEM_MSG, user_msg]
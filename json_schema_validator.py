@@ -1,19 +1,78 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Type
 
+import fastjsonschema
 from jsonschema import Draft7Validator
 from jsonschema.protocols import Validator  # type: ignore[import-not-found]
 
 from .loader import load_schema
 
+try:  # Optional native backend: `pip install beeflow-ai-toolkit[rust]`.
+    import jsonschema_rs  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    jsonschema_rs = None
+
+Backend = Literal["fast", "rust"]
+
+_DRAFT7_URI = "http://json-schema.org/draft-07/schema#"
+
+
+def _json_path(parts: Iterable[str | int]) -> str:
+    """Build a JSONPath-like pointer (readable for humans, simple for logs)."""
+    return "$" + "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in parts)
+
+
+def _has_remote_ref(schema: Any) -> bool:
+    """Return whether `schema` contains a `$ref` that does not point inside the document."""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            return True
+        return any(_has_remote_ref(v) for v in schema.values())
+    if isinstance(schema, list):
+        return any(_has_remote_ref(v) for v in schema)
+    return False
+
 
 class JsonSchemaValidator:
-    """Generic JSON Schema validator (draft-07 by default)."""
+    """Generic JSON Schema validator (draft-07 by default).
+
+    By default the schema is compiled with ``fastjsonschema`` into specialised Python code,
+    which keeps the common (valid payload) path cheap. ``backend="rust"`` uses the native
+    ``jsonschema-rs`` validator when it is installed (falling back to the default otherwise).
+    Passing ``validator_cls`` explicitly selects a plain ``jsonschema`` validator instead.
 
-    def __init__(self, schema: Dict[str, Any], validator_cls: Type[Validator] = Draft7Validator) -> None:
+    The compiled validator always applies draft-07 rules, whatever ``$schema`` says, like
+    ``Draft7Validator``. Schemas with remote ``$ref`` URIs are not compiled (that would fetch
+    them at construction); they are validated by ``Draft7Validator`` alone. The compiled path
+    targets decoded JSON: it also accepts tuples as arrays, so pass
+    ``validator_cls=Draft7Validator`` to validate arbitrary Python objects strictly.
+    """
+
+    def __init__(
+        self,
+        schema: Dict[str, Any],
+        validator_cls: Optional[Type[Validator]] = None,
+        backend: Backend = "fast",
+    ) -> None:
+        if backend not in ("fast", "rust"):
+            raise ValueError(f"Unknown validation backend: {backend!r}")
         # Keep responsibility narrow: hold a compiled validator instance.
-        self._compiled = validator_cls(schema)
+        # The caller guarantees `schema` is valid; it is not checked against the meta-schema.
+        # Defaults are not injected and formats are not asserted, matching `Draft7Validator`.
+        use_rust = validator_cls is None and backend == "rust" and jsonschema_rs is not None
+        self._rust: Any = jsonschema_rs.Draft7Validator(schema, validate_formats=False) if use_rust else None
+        # `$schema` is forced to draft-07 because fastjsonschema picks its draft from it.
+        self._fast: Optional[Callable[[Any], Any]] = (
+            fastjsonschema.compile({**schema, "$schema": _DRAFT7_URI}, use_default=False, use_formats=False)
+            if validator_cls is None and not use_rust and not _has_remote_ref(schema)
+            else None
+        )
+        # The interpretive validator is kept for detailed, exhaustive error reports; the native
+        # backend reports all errors itself, so it is not needed there.
+        self._compiled: Any = None if use_rust else (validator_cls or Draft7Validator)(schema)
 
     def validate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -22,22 +81,73 @@ class JsonSchemaValidator:
         Returns:
             {"ok": bool, "errors": List[str]}
         """
-        errors = sorted(self._compiled.iter_errors(payload), key=lambda e: e.path)
+        if self._rust is not None:
+            rust_errors = list(self._rust.iter_errors(payload))
+            rust_errors.sort(key=lambda e: tuple(e.instance_path))
+            if not rust_errors:
+                return {"ok": True, "errors": []}
+            return {"ok": False, "errors": [f"{_json_path(e.instance_path)}: {e.message}" for e in rust_errors]}
+
+        fast_error: Optional[fastjsonschema.JsonSchemaException] = None
+        if self._fast is not None:
+            try:
+                self._fast(payload)
+            except fastjsonschema.JsonSchemaException as e:
+                fast_error = e
+            else:
+                return {"ok": True, "errors": []}
+
+        # Sort by tuple paths: cheap, native comparisons instead of comparing deques.
+        errors = list(self._compiled.iter_errors(payload))
+        errors.sort(key=lambda e: tuple(e.path))
         if not errors:
+            if fast_error is not None:
+                # The compiled validator is authoritative; report its (first) error.
+                return {"ok": False, "errors": [self._format_fast_error(fast_error)]}
             return {"ok": True, "errors": []}
 
         msgs: List[str] = []
         for err in errors:
-            # Build a JSONPath-like pointer (readable for humans, simple for logs).
-            path = "$"
-            for p in err.path:
-                path += f"[{p}]" if isinstance(p, int) else f".{p}"
-            ctx_lines = [f"- {c.message}" for c in (err.context or [])]
-            ctx = "\n    Details:\n    " + "\n    ".join(ctx_lines) if ctx_lines else ""
+            path = _json_path(err.path)
+            ctx = ("\n    Details:\n    " + "\n    ".join(f"- {c.message}" for c in err.context)) if err.context else ""
             msgs.append(f"{path}: {err.message}{ctx}")
 
         return {"ok": False, "errors": msgs}
 
+    def validate_many(self, payloads: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazily validate payloads with the already-compiled validator.
+
+        Yields one `validate` result per payload, in input order.
+        """
+        validate = self.validate
+        for payload in payloads:
+            yield validate(payload)
+
+    def is_valid(self, payload: Dict[str, Any]) -> bool:
+        """Return whether `payload` is valid, stopping at the first error.
+
+        Cheaper than `validate` when the error messages are not needed.
+        """
+        if self._rust is not None:
+            return self._rust.is_valid(payload)
+        if self._fast is not None:
+            try:
+                self._fast(payload)
+            except fastjsonschema.JsonSchemaException:
+                return False
+            return True
+        return self._compiled.is_valid(payload)
+
+    @staticmethod
+    def _format_fast_error(error: fastjsonschema.JsonSchemaException) -> str:
+        """Render a `fastjsonschema` error in the same `$.path: message` shape."""
+        name = getattr(error, "name", None) or "data"
+        message = error.message or str(error)
+        # fastjsonschema names the root "data" and prefixes messages with the full name.
+        if message.startswith(name):
+            message = message[len(name) :].lstrip()
+        return f"${name[len('data'):]}: {message}"
+
 
 class SchemaValidatorLoader(JsonSchemaValidator):
     """
@@ -50,7 +160,9 @@ class SchemaValidatorLoader(JsonSchemaValidator):
     Attributes:
         schema_pkg (str): The name of the package containing the JSON schema.
         schema_name (str): The name or identifier of the specific schema within the package.
-        validator_cls (Type[Validator]): Validator class to use (default: Draft7Validator).
+        validator_cls (Optional[Type[Validator]]): Validator class to use (default: compiled
+            `fastjsonschema` validator).
+        backend (Backend): Compiled backend used when `validator_cls` is not given.
         schema_loader (Callable[[str, str], Dict[str, Any]]): Function to load the schema.
     """
 
@@ -58,9 +170,46 @@ class SchemaValidatorLoader(JsonSchemaValidator):
         self,
         schema_pkg: str,
         schema_name: str,
-        validator_cls: Type[Validator] = Draft7Validator,
+        validator_cls: Optional[Type[Validator]] = None,
         schema_loader: Callable[[str, str], Dict[str, Any]] = load_schema,
+        backend: Backend = "fast",
     ) -> None:
         # Load schema using the provided loader and pass to the base class.
+        # Bundled schemas are trusted: like the base class, skip meta-schema validation.
         schema = schema_loader(schema_pkg, schema_name)
-        super().__init__(schema=schema, validator_cls=validator_cls)
+        super().__init__(schema=schema, validator_cls=validator_cls, backend=backend)
+
+    @classmethod
+    def get(
+        cls,
+        schema_pkg: str,
+        schema_name: str,
+        validator_cls: Optional[Type[Validator]] = None,
+        schema_loader: Callable[[str, str], Dict[str, Any]] = load_schema,
+        backend: Backend = "fast",
+    ) -> SchemaValidatorLoader:
+        """Return a process-wide shared validator for a packaged schema.
+
+        Bundled schemas are immutable, so the loaded and compiled validator is memoised by
+        `(schema_pkg, schema_name, validator_cls, backend)`. A custom `schema_loader` (or a subclass)
+        bypasses the cache, as its output is not guaranteed to be stable.
+        """
+        if schema_loader is not load_schema or cls is not SchemaValidatorLoader:
+            return cls(
+                schema_pkg,
+                schema_name,
+                validator_cls=validator_cls,
+                schema_loader=schema_loader,
+                backend=backend,
+            )
+        return _build_loader(schema_pkg, schema_name, validator_cls, backend)
+
+
+@lru_cache(maxsize=None)
+def _build_loader(
+    schema_pkg: str,
+    schema_name: str,
+    validator_cls: Optional[Type[Validator]],
+    backend: Backend,
+) -> SchemaValidatorLoader:
+    return SchemaValidatorLoader(schema_pkg, schema_name, validator_cls=validator_cls, backend=backend)
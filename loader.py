@@ -1,16 +1,21 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Dict
 
 # Keep validators decoupled from I/O; this loader just fetches schema dicts.
 
 
+@lru_cache(maxsize=128)
 def load_schema(package: str, name: str) -> Dict[str, Any]:
     """
     Load a JSON schema bundled as package data.
     Example: load_schema('schemas.student_worksheets', 'student-worksheet.schema.v1.json')
+
+    Results are cached per `(package, name)` and the same dict is returned on every call;
+    treat it as read-only (copy it before making changes).
     """
     with resources.files(package).joinpath(name).open("r", encoding="utf-8") as f:
         return json.load(f)
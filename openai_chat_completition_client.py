@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Protocol
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Mapping, Optional, Protocol
 
+import httpx
 import openai
 from openai.types.chat import ChatCompletionMessageParam
 
@@ -28,6 +32,67 @@ class ChatCompletionClient(Protocol):
         """Return assistant message content (string)."""
         ...
 
+    def create_stream(
+        self,
+        *,
+        model_name: str,
+        messages: list[ChatCompletionMessageParam],
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+    ) -> Iterator[str]:
+        """Yield assistant message content fragments as they arrive.
+
+        Closing the returned iterator early should cancel the upstream generation.
+        """
+        ...
+
+
+# Keep TLS connections alive and multiplex requests over HTTP/2 for high-QPS use.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+
+def _module_client_options() -> dict[str, Any]:
+    """Return settings configured on the ``openai`` module (e.g. ``openai.base_url``).
+
+    Dedicated clients forward them so module-level configuration keeps applying.
+    """
+    return {
+        "organization": openai.organization,
+        "project": openai.project,
+        "base_url": openai.base_url,
+        "timeout": openai.timeout,
+        "max_retries": openai.max_retries,
+        "default_headers": openai.default_headers,
+        "default_query": openai.default_query,
+    }
+
+
+@dataclass(slots=True)
+class ChatCompletionRequest:
+    """A single chat completion request, used by the batch-oriented clients."""
+
+    model_name: str
+    messages: list[ChatCompletionMessageParam]
+    max_tokens: Optional[int] = None
+    top_p: float = 1.0
+
+
+def _build_params(
+    model_name: str,
+    messages: list[ChatCompletionMessageParam],
+    max_tokens: Optional[int],
+    top_p: float,
+) -> dict[str, Any]:
+    """Return Chat Completions parameters, omitting `max_tokens` when it is None."""
+    api_params: dict[str, Any] = {
+        "model": model_name,
+        "messages": messages,
+        "top_p": top_p,
+    }
+    if max_tokens is not None:
+        api_params["max_tokens"] = max_tokens
+    return api_params
+
 
 # Minimal protocols to support DI without mocks or patches.
 class _HasMessage(Protocol):
@@ -53,25 +118,68 @@ class ChatCompletionsCreate(Protocol):
     ) -> _HasChoicesResponse: ...
 
 
+class AsyncChatCompletionsCreate(Protocol):
+    def __call__(
+        self,
+        *,
+        model: str,
+        messages: list[ChatCompletionMessageParam],
+        top_p: float,
+        max_tokens: Optional[int] = None,
+    ) -> Awaitable[_HasChoicesResponse]: ...
+
+
 class OpenAIChatCompletionClient:
     """OpenAI Chat Completions client.
 
     If no API key is provided, it is read from the environment
     variable "OPENAI_API_KEY". A callable implementing
     ``ChatCompletionsCreate`` may be injected for tests.
+
+    Requests go through a dedicated ``openai.OpenAI`` client configured from the
+    ``openai`` module settings (``base_url``, ``organization``, ``timeout``,
+    ``max_retries``, ...) and backed by a pooled HTTP/2 connection. The pool
+    belongs to the instance: reuse one client (or pass a shared ``http_client``,
+    which is then left open) and ``close()`` it, or use it as a context manager.
     """
 
     def __init__(
         self,
         api_key: Optional[str] = os.environ.get("OPENAI_API_KEY"),
         openai_create: Optional[ChatCompletionsCreate] = None,
+        http_client: Optional[httpx.Client] = None,
     ) -> None:
+        # Resolve the environment at construction time, as the module-level client used to.
+        if api_key is None:
+            api_key = os.environ.get("OPENAI_API_KEY")
+        # Kept for backward compatibility: callers (and `BatchChatCompletionClient`) may
+        # rely on the module-level client picking up the key configured here.
         openai.api_key = api_key
+        self._client: Optional[openai.OpenAI] = None
+        self._owns_http_client = False
         # Dependency injection: allow tests to pass a simple stub instead of
         # patching.
-        self._create: ChatCompletionsCreate = (
-            openai_create or openai.chat.completions.create  # type: ignore[assignment]
-        )
+        if openai_create is None:
+            http_client = http_client or openai.http_client
+            self._owns_http_client = http_client is None
+            self._client = openai.OpenAI(
+                api_key=api_key,
+                http_client=http_client or openai.DefaultHttpxClient(http2=True, limits=_HTTP_LIMITS),
+                **_module_client_options(),
+            )
+            openai_create = self._client.chat.completions.create  # type: ignore[assignment]
+        self._create: ChatCompletionsCreate = openai_create  # type: ignore[assignment]
+
+    def close(self) -> None:
+        """Close the connection pool created by this client (a shared one is left open)."""
+        if self._client is not None and self._owns_http_client:
+            self._client.close()
+
+    def __enter__(self) -> OpenAIChatCompletionClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # noinspection PyMethodMayBeStatic
     def create(
@@ -82,20 +190,212 @@ class OpenAIChatCompletionClient:
         max_tokens: Optional[int] = None,
         top_p: float = 1.0,
     ) -> str:
-        # Prepare parameters for OpenAI API call
-        api_params = {
-            "model": model_name,
-            "messages": messages,
-            "top_p": top_p,
-        }
+        # Prepare parameters for OpenAI API call (max_tokens only when provided).
+        api_params = _build_params(model_name, messages, max_tokens, top_p)
+        response = self._create(**api_params)  # type: ignore[arg-type]
+        return (response.choices[0].message.content or "").strip()
 
-        # Only include max_tokens if it's not None
-        if max_tokens is not None:
-            api_params["max_tokens"] = max_tokens
+    def create_stream(
+        self,
+        *,
+        model_name: str,
+        messages: list[ChatCompletionMessageParam],
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+    ) -> Iterator[str]:
+        api_params = _build_params(model_name, messages, max_tokens, top_p)
+        response = self._create(**api_params, stream=True)  # type: ignore[call-arg]
+        try:
+            for chunk in response:  # type: ignore[attr-defined]
+                # Some chunks (e.g. usage reports) carry no choices.
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        finally:
+            # Closing the HTTP stream stops the upstream generation when the caller stops early.
+            close = getattr(response, "close", None)
+            if close is not None:
+                close()
+
+
+class AsyncOpenAIChatCompletionClient:
+    """Asynchronous OpenAI Chat Completions client with bounded fan-out.
+
+    ``create_many`` keeps up to ``concurrency`` requests in flight at once, so
+    throughput is no longer bound by one round trip per request. If no API key
+    is provided, it is read from the environment variable "OPENAI_API_KEY". An
+    async callable implementing ``AsyncChatCompletionsCreate`` may be injected
+    for tests. As with the sync client, the ``openai`` module settings are
+    forwarded and ``http_client`` defaults to a pooled HTTP/2 connection owned
+    by the instance; release it with ``aclose()``/``close()`` or ``async with``.
+    """
 
-        response = self._create(**api_params)  # type: ignore[arg-type]
+    def __init__(
+        self,
+        api_key: Optional[str] = os.environ.get("OPENAI_API_KEY"),
+        openai_create: Optional[AsyncChatCompletionsCreate] = None,
+        concurrency: int = 16,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        self.concurrency = concurrency
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._owns_http_client = openai_create is None and http_client is None
+        # Private loop for `create_many_sync`; pooled connections are bound to one loop.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        if openai_create is None:
+            self._client = openai.AsyncOpenAI(
+                api_key=api_key,
+                http_client=http_client or openai.DefaultAsyncHttpxClient(http2=True, limits=_HTTP_LIMITS),
+                **_module_client_options(),
+            )
+            openai_create = self._client.chat.completions.create  # type: ignore[assignment]
+        self._create: AsyncChatCompletionsCreate = openai_create  # type: ignore[assignment]
+
+    async def create(
+        self,
+        *,
+        model_name: str,
+        messages: list[ChatCompletionMessageParam],
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+    ) -> str:
+        api_params = _build_params(model_name, messages, max_tokens, top_p)
+        response = await self._create(**api_params)  # type: ignore[arg-type]
         return (response.choices[0].message.content or "").strip()
 
+    async def create_many(self, requests: Iterable[ChatCompletionRequest]) -> list[str | BaseException]:
+        """Run the requests concurrently and return results in input order.
+
+        A failed request yields its exception in place of the content, so one error does
+        not discard the other results.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run(req: ChatCompletionRequest) -> str:
+            async with semaphore:
+                return await self.create(
+                    model_name=req.model_name,
+                    messages=req.messages,
+                    max_tokens=req.max_tokens,
+                    top_p=req.top_p,
+                )
+
+        return await asyncio.gather(*(run(req) for req in requests), return_exceptions=True)
+
+    def create_many_sync(self, requests: Iterable[ChatCompletionRequest]) -> list[str | BaseException]:
+        """Synchronous wrapper around ``create_many`` (must not be called from a running loop).
+
+        All synchronous calls share one private event loop, so pooled connections opened by
+        an earlier call stay usable. Call ``close`` when done.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.create_many(requests))
+
+    async def aclose(self) -> None:
+        """Close the connection pool created by this client (a shared one is left open)."""
+        if self._client is not None and self._owns_http_client:
+            await self._client.close()
+
+    async def __aenter__(self) -> AsyncOpenAIChatCompletionClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Synchronously close the client and the private loop used by ``create_many_sync``."""
+        loop = self._loop if self._loop is not None and not self._loop.is_closed() else asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self.aclose())
+        finally:
+            loop.close()
+            self._loop = None
+
+
+class _HasBatchAPIs(Protocol):
+    files: Any
+    batches: Any
+
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class BatchChatCompletionClient:
+    """OpenAI Batch API client for offline chat completions.
+
+    Requests are serialised to JSONL, uploaded via the Files API and processed
+    asynchronously by OpenAI (24h completion window, at a lower price than
+    synchronous calls). Use ``submit`` to start a batch, ``poll`` to check its
+    status and ``results`` to collect the assistant messages once completed.
+
+    If no API key is provided, it is read from the environment variable
+    "OPENAI_API_KEY". An object exposing ``files`` and ``batches`` (like the
+    ``openai`` module or an ``openai.OpenAI`` instance) may be injected for tests.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = os.environ.get("OPENAI_API_KEY"),
+        openai_client: Optional[_HasBatchAPIs] = None,
+    ) -> None:
+        openai.api_key = api_key
+        self._client: _HasBatchAPIs = openai_client or openai  # type: ignore[assignment]
+
+    def submit(self, requests: Mapping[str, ChatCompletionRequest]) -> str:
+        """Upload the requests keyed by `custom_id` and return the created batch id."""
+        if not requests:
+            raise ValueError("At least one request is required to create a batch.")
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": _build_params(req.model_name, req.messages, req.max_tokens, req.top_p),
+                }
+            )
+            for custom_id, req in requests.items()
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+        input_file = self._client.files.create(file=("batch.jsonl", payload), purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def poll(self, batch_id: str) -> str:
+        """Return the current batch status (e.g. "in_progress", "completed", "failed")."""
+        return self._client.batches.retrieve(batch_id).status
+
+    def results(self, batch_id: str) -> dict[str, str]:
+        """Return assistant message contents keyed by `custom_id` for a completed batch.
+
+        Requests that failed are omitted; their details are available in the batch's
+        error file.
+        """
+        batch = self._client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch_id} is not completed (status: {batch.status}).")
+        if not batch.output_file_id:
+            return {}
+
+        output = self._client.files.content(batch.output_file_id).text
+        contents: dict[str, str] = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            message = response["body"]["choices"][0]["message"]
+            contents[record["custom_id"]] = (message.get("content") or "").strip()
+        return contents
+
 
 class BaseContentGenerator(ABC):
     """Base class for generating content via a chat-based model.
@@ -105,7 +405,8 @@ class BaseContentGenerator(ABC):
     ``generate(...) -> str``.
 
     Attributes:
-        prompt_builder: Builder used to construct prompts.
+        prompt_builder: Builder used to construct prompts; may be None when a
+            subclass builds prompts per call.
         chat_completion_client: Client for interacting with the chat model.
         schema_validator: Optional JSON schema validator.
         model_name: Model name; defaults to ``gpt-5`` or
@@ -114,12 +415,12 @@ class BaseContentGenerator(ABC):
 
     def __init__(
         self,
-        prompt_builder: PromptBuilder,
+        prompt_builder: Optional[PromptBuilder],
         chat_completion_client: ChatCompletionClient,
         schema_validator: Optional[JsonSchemaValidator] = None,
         model_name: str = os.environ.get("STORY_GENERATION_MODEL", "gpt-5"),
     ) -> None:
-        self.prompt_builder: PromptBuilder = prompt_builder
+        self.prompt_builder: Optional[PromptBuilder] = prompt_builder
         self.chat_completion_client: ChatCompletionClient = chat_completion_client
         self.model_name: str = model_name
         self.schema_validator: Optional[JsonSchemaValidator] = schema_validator
@@ -131,12 +432,19 @@ class BaseContentGenerator(ABC):
 
 
 _CONTENT_GENERATORS: dict[str, BaseContentGenerator] = {}
+# Sorted snapshot of the registry keys; registration is rare, reads are frequent.
+_SORTED_MODEL_NAMES: list[str] = []
+
+
+def _register(generator: BaseContentGenerator) -> None:
+    _CONTENT_GENERATORS[generator.model_name] = generator
+    _SORTED_MODEL_NAMES[:] = sorted(_CONTENT_GENERATORS)
 
 
 def register_content_generator(func: Callable[..., BaseContentGenerator]):
     def wrapper(*args, **kwargs):
         content_generator = func(*args, **kwargs)
-        _CONTENT_GENERATORS[content_generator.model_name] = content_generator
+        _register(content_generator)
         return content_generator
 
     return wrapper
@@ -154,7 +462,7 @@ class ContentGeneratorRegistry:
     @staticmethod
     def register(generator: BaseContentGenerator) -> None:
         """Register a generator instance under its `model_name`."""
-        _CONTENT_GENERATORS[generator.model_name] = generator
+        _register(generator)
 
     @staticmethod
     def get(model_name: str) -> Optional[BaseContentGenerator]:
@@ -164,9 +472,10 @@ class ContentGeneratorRegistry:
     @staticmethod
     def available_models() -> list[str]:
         """Return a sorted list of model names currently registered."""
-        return sorted(_CONTENT_GENERATORS.keys())
+        return list(_SORTED_MODEL_NAMES)
 
     @staticmethod
     def clear() -> None:
         """Remove all registered generators (useful in tests)."""
         _CONTENT_GENERATORS.clear()
+        _SORTED_MODEL_NAMES.clear()
@@ -9,9 +9,10 @@ All comments and docstrings use British English spelling.
 
 from __future__ import annotations
 
-from .poker_feedback_prompt_builder import PokerFeedbackPromptBuilder, PokerStats
+from .poker_feedback_prompt_builder import POKER_STATS_SCHEMA, PokerFeedbackPromptBuilder, PokerStats
 
 __all__ = [
+    "POKER_STATS_SCHEMA",
     "PokerFeedbackPromptBuilder",
     "PokerStats",
 ]
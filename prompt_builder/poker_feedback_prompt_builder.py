@@ -10,15 +10,15 @@ and formatting.
 All comments and docstrings use British English spelling. Lines are kept under 100 chars.
 """
 
-from dataclasses import dataclass
-from typing import Iterable, Mapping, TypedDict
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterable, Mapping, TypedDict
 
 
 class PokerStats(TypedDict, total=False):
     """Minimal set of poker session statistics expected by the builder.
 
     Values should be pre-aggregated for a single session. Rates are percentages in [0, 100].
-    All numeric values are expected to be non-negative.
+    All numeric values except `net_profit_bb` are expected to be non-negative.
     """
 
     hands_played: int
@@ -33,6 +33,49 @@ class PokerStats(TypedDict, total=False):
     leaks: list[str]
 
 
+_RATE: dict[str, Any] = {"type": "number", "minimum": 0, "maximum": 100}
+_COUNT: dict[str, Any] = {"type": "integer", "minimum": 0}
+_LABELS: dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+
+# JSON Schema mirroring `PokerStats`; keep both in sync. It encodes the contract documented
+# above and nothing more: the annotated types, rates within [0, 100], no negative numbers
+# except `net_profit_bb`. Every key is optional; the builder skips missing ones.
+POKER_STATS_SCHEMA: dict[str, Any] = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "properties": {
+        "hands_played": _COUNT,
+        "vpip": _RATE,
+        "pfr": _RATE,
+        "three_bet": _RATE,
+        "aggression_factor": {"type": "number", "minimum": 0},
+        "showdown_win_rate": _RATE,
+        "net_profit_bb": {"type": "integer"},
+        "session_minutes": _COUNT,
+        "strengths": _LABELS,
+        "leaks": _LABELS,
+    },
+}
+
+
+def _fmt_val(value: object) -> str:
+    """Format a scalar compactly: floats rounded to 1 decimal, anything else stringified."""
+    return f"{value:.1f}" if isinstance(value, float) else str(value)
+
+
+# Stats rendered in the prompt, in a fixed order: (key, label).
+_STATS_FIELDS: tuple[tuple[str, str], ...] = (
+    ("hands_played", "hands"),
+    ("vpip", "vpip%"),
+    ("pfr", "pfr%"),
+    ("three_bet", "3bet%"),
+    ("aggression_factor", "AF"),
+    ("showdown_win_rate", "sd_win%"),
+    ("net_profit_bb", "profit_bb"),
+    ("session_minutes", "mins"),
+)
+
+
 @dataclass(slots=True)
 class PokerFeedbackPromptBuilder:
     """Build a concise instruction prompt for poker feedback generation.
@@ -42,10 +85,38 @@ class PokerFeedbackPromptBuilder:
     with 2-3 sentences of plain text in the selected language.
     """
 
+    # Prompt wording, specialised once per instance with `str.format_map`.
+    _HEADER_TPL: ClassVar[str] = (
+        "Provide concise poker coaching feedback based on the session stats below. "
+        "Respond in {lang}. Use 2-3 sentences, max {max_chars} "
+        "characters, plain text only (no emojis, no markdown, no lists). Focus on "
+        "1-2 strengths and 1-2 clear improvements."
+    )
+
     stats: PokerStats
     language_code: str = "pl"
     max_chars: int = 280
     tone: str = "neutral"
+    # Static prompt parts, rendered from the fields above and refreshed when they change.
+    _header: str = field(init=False, repr=False, compare=False)
+    _tone_line: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._render_header()
+        self._tone_line = self._tone_hint(self.tone)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Keep the cached parts in step with later assignments (not those made by `__init__`,
+        # which run before `__post_init__` has rendered anything).
+        if name == "tone" and hasattr(self, "_tone_line"):
+            object.__setattr__(self, "_tone_line", self._tone_hint(value))
+        elif name in ("language_code", "max_chars") and hasattr(self, "_header"):
+            self._render_header()
+
+    def _render_header(self) -> None:
+        header = self._HEADER_TPL.format_map({"lang": self.language_code, "max_chars": self.max_chars})
+        object.__setattr__(self, "_header", header)
 
     def build(self) -> str:
         """Return a complete user prompt for the LLM.
@@ -54,17 +125,10 @@ class PokerFeedbackPromptBuilder:
         - Audience and constraints (language, length, no formatting, 2-3 sentences).
         - Compact, rounded statistics to ground the response.
         - Focus guidance: highlight 1–2 strengths and 1–2 improvements.
-        """
-        header = (
-            "Provide concise poker coaching feedback based on the session stats below. "
-            f"Respond in {self.language_code}. Use 2-3 sentences, max {self.max_chars} "
-            "characters, plain text only (no emojis, no markdown, no lists). Focus on "
-            "1-2 strengths and 1-2 clear improvements."
-        )
 
-        stats_line = self._format_stats(self.stats)
-        tone_line = self._tone_hint(self.tone)
-        return f"{header}\nTone:{tone_line}\nStats:{stats_line}"
+        Language, length and tone are pre-rendered; only the stats are formatted here.
+        """
+        return f"{self._header}\nTone:{self._tone_line}\nStats:{self._format_stats(self.stats)}"
 
     @staticmethod
     def _tone_hint(tone: str) -> str:
@@ -80,20 +144,6 @@ class PokerFeedbackPromptBuilder:
         key = (tone or "").strip().lower()
         return tone_map.get(key, tone_map["neutral"])
 
-    @staticmethod
-    def _fmt_val(value: object) -> str:
-        """Format a scalar value compactly with limited precision.
-
-        - Integers rendered as is
-        - Floats rounded to 1 decimal
-        - Other objects stringified safely
-        """
-        if isinstance(value, int):
-            return str(value)
-        if isinstance(value, float):
-            return f"{value:.1f}"
-        return str(value)
-
     @classmethod
     def _format_stats(cls, stats: PokerStats) -> str:
         """Return a single-line compact representation of key stats.
@@ -101,20 +151,8 @@ class PokerFeedbackPromptBuilder:
         Only includes known, non-missing keys in a fixed order to keep prompts stable.
         Lists are joined with '; ' when present.
         """
-        order: list[tuple[str, str]] = [
-            ("hands_played", "hands"),
-            ("vpip", "vpip%"),
-            ("pfr", "pfr%"),
-            ("three_bet", "3bet%"),
-            ("aggression_factor", "AF"),
-            ("showdown_win_rate", "sd_win%"),
-            ("net_profit_bb", "profit_bb"),
-            ("session_minutes", "mins"),
-        ]
-        parts: list[str] = []
-        for key, label in order:
-            if key in stats:
-                parts.append(f"{label}:{cls._fmt_val(stats[key])}")
+        values: Mapping[str, object] = stats
+        parts = [f"{label}:{_fmt_val(values[key])}" for key, label in _STATS_FIELDS if key in values]
         strengths = stats.get("strengths")
         leaks = stats.get("leaks")
         if strengths:
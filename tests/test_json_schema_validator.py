@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import pytest
+from jsonschema import Draft7Validator
+
 from beeflow_ai.json_schema_validator import JsonSchemaValidator, SchemaValidatorLoader
 
 
@@ -48,3 +51,101 @@ def test_schema_validator_loader_uses_injected_loader():
     assert ok["ok"] is True
     bad = v.validate({"value": "x"})
     assert bad["ok"] is False
+
+
+def test_json_schema_validator_explicit_validator_cls_uses_jsonschema():
+    schema: Dict[str, Any] = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+    }
+
+    fast = JsonSchemaValidator(schema)
+    plain = JsonSchemaValidator(schema, validator_cls=Draft7Validator)
+
+    for v in (fast, plain):
+        assert v.is_valid({"tags": ["a", "b"]}) is True
+        assert v.is_valid({"tags": ["a", 1]}) is False
+        assert v.validate({"tags": ["a", "b"]}) == {"ok": True, "errors": []}
+        bad = v.validate({"tags": ["a", 1]})
+        assert bad["ok"] is False
+        assert bad["errors"] == ["$.tags[1]: 1 is not of type 'string'"]
+
+
+def test_schema_validator_loader_get_caches_packaged_schemas(tmp_path, monkeypatch):
+    pkg = tmp_path / "cached_schemas_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "value.schema.json").write_text('{"type": "object", "properties": {"value": {"type": "integer"}}}')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    first = SchemaValidatorLoader.get("cached_schemas_pkg", "value.schema.json")
+    assert SchemaValidatorLoader.get("cached_schemas_pkg", "value.schema.json") is first
+    assert SchemaValidatorLoader.get("cached_schemas_pkg", "value.schema.json", Draft7Validator) is not first
+    assert first.validate({"value": "x"})["ok"] is False
+
+    calls: list[str] = []
+
+    def fake_loader(pkg_name: str, name: str) -> Dict[str, Any]:
+        calls.append(name)
+        return {"type": "object"}
+
+    SchemaValidatorLoader.get("unused", "unused", schema_loader=fake_loader)
+    SchemaValidatorLoader.get("unused", "unused", schema_loader=fake_loader)
+    assert calls == ["unused", "unused"]
+
+
+def test_json_schema_validator_rust_backend_reports_errors_in_same_shape():
+    pytest.importorskip("jsonschema_rs")
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+        "required": ["tags"],
+    }
+
+    v = JsonSchemaValidator(schema, backend="rust")
+    assert v.is_valid({"tags": ["a"]}) is True
+    assert v.is_valid({}) is False
+    assert v.validate({"tags": ["a"]}) == {"ok": True, "errors": []}
+    bad = v.validate({"tags": ["a", 1]})
+    assert bad["ok"] is False
+    assert len(bad["errors"]) == 1
+    assert bad["errors"][0].startswith("$.tags[1]: ")
+
+
+def test_json_schema_validator_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        JsonSchemaValidator({"type": "object"}, backend="nope")  # type: ignore[arg-type]
+
+
+def test_json_schema_validator_validate_many_streams_results_in_order():
+    v = JsonSchemaValidator({"type": "object", "properties": {"value": {"type": "integer"}}})
+
+    results = v.validate_many(iter([{"value": 1}, {"value": "x"}, {}]))
+    assert [r["ok"] for r in results] == [True, False, True]
+
+
+def test_json_schema_validator_applies_draft7_rules_regardless_of_declared_draft():
+    conditional: Dict[str, Any] = {
+        "$schema": "http://json-schema.org/draft-06/schema#",
+        "if": {"required": ["a"]},
+        "then": {"required": ["b"]},
+    }
+    integer: Dict[str, Any] = {"$schema": "http://json-schema.org/draft-04/schema#", "type": "integer"}
+
+    for schema, payload in ((conditional, {"a": 1}), (integer, 1.0)):
+        fast = JsonSchemaValidator(schema)
+        plain = JsonSchemaValidator(schema, validator_cls=Draft7Validator)
+        assert fast.is_valid(payload) is plain.is_valid(payload)
+        assert fast.validate(payload)["ok"] is plain.validate(payload)["ok"]
+
+    assert JsonSchemaValidator(conditional).is_valid({"a": 1}) is False
+    assert JsonSchemaValidator(integer).is_valid(1.0) is True
+
+
+def test_json_schema_validator_does_not_fetch_remote_refs_at_construction():
+    schema: Dict[str, Any] = {"type": "object", "properties": {"a": {"$ref": "http://127.0.0.1:9/x.json"}}}
+
+    v = JsonSchemaValidator(schema)
+    assert v.is_valid({}) is True
+    assert v.validate({}) == {"ok": True, "errors": []}
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from beeflow_ai.loader import load_schema
+
+
+def test_load_schema_reads_package_data_once(tmp_path, monkeypatch):
+    pkg = tmp_path / "loader_schemas_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    schema_file = pkg / "item.schema.json"
+    schema_file.write_text('{"type": "object"}')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    first = load_schema("loader_schemas_pkg", "item.schema.json")
+    assert first == {"type": "object"}
+
+    # Subsequent calls are served from memory, even if the file disappears.
+    schema_file.unlink()
+    assert load_schema("loader_schemas_pkg", "item.schema.json") is first
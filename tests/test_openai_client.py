@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import json
+from types import SimpleNamespace
 from typing import Any, Dict, List
 
+import httpx
 import openai
+import pytest
 
-from beeflow_ai.openai_chat_completition_client import OpenAIChatCompletionClient
+from beeflow_ai.openai_chat_completition_client import (
+    AsyncOpenAIChatCompletionClient,
+    BatchChatCompletionClient,
+    ChatCompletionRequest,
+    OpenAIChatCompletionClient,
+)
 
 
 class _StubMessage:
@@ -70,7 +80,194 @@ def test_create_strips_content_and_passes_params(monkeypatch):
     assert stub.calls[-1]["max_tokens"] == 42
 
 
+class _StubStream:
+    def __init__(self, pieces: List[str | None]) -> None:
+        self._chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=p))]) for p in pieces]
+        self._chunks.append(SimpleNamespace(choices=[]))  # e.g. a trailing usage chunk
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_create_stream_yields_deltas_and_closes_response():
+    calls: List[Dict[str, Any]] = []
+    stream = _StubStream(["he", None, "llo"])
+
+    def stub_create(**kwargs):
+        calls.append(kwargs)
+        return stream
+
+    client = OpenAIChatCompletionClient(api_key="key", openai_create=stub_create)
+    pieces = list(client.create_stream(model_name="m", messages=[{"role": "user", "content": "x"}], top_p=0.5))
+
+    assert pieces == ["he", "", "llo"]
+    assert calls[-1]["stream"] is True
+    assert calls[-1]["top_p"] == 0.5
+    assert "max_tokens" not in calls[-1]
+    assert stream.closed is True
+
+
 def test_reads_api_key_from_env(monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "env-key")
     _ = OpenAIChatCompletionClient()  # no explicit key
     assert openai.api_key == "env-key"
+
+
+class StubFiles:
+    def __init__(self) -> None:
+        self.uploads: List[Dict[str, Any]] = []
+        self.contents: Dict[str, str] = {}
+
+    def create(self, *, file, purpose):
+        self.uploads.append({"file": file, "purpose": purpose})
+        return SimpleNamespace(id="file-in")
+
+    def content(self, file_id: str):
+        return SimpleNamespace(text=self.contents[file_id])
+
+
+class StubBatches:
+    def __init__(self) -> None:
+        self.created: List[Dict[str, Any]] = []
+        self.status = "in_progress"
+
+    def create(self, **kwargs):
+        self.created.append(kwargs)
+        return SimpleNamespace(id="batch-1")
+
+    def retrieve(self, batch_id: str):
+        return SimpleNamespace(id=batch_id, status=self.status, output_file_id="file-out")
+
+
+def test_batch_client_submits_jsonl_polls_and_collects_results():
+    files, batches = StubFiles(), StubBatches()
+    client = BatchChatCompletionClient(api_key="key", openai_client=SimpleNamespace(files=files, batches=batches))
+
+    batch_id = client.submit(
+        {
+            "a": ChatCompletionRequest(model_name="m", messages=[{"role": "user", "content": "x"}], max_tokens=8),
+            "b": ChatCompletionRequest(model_name="m", messages=[{"role": "user", "content": "y"}]),
+        }
+    )
+    assert batch_id == "batch-1"
+    assert batches.created[-1] == {
+        "input_file_id": "file-in",
+        "endpoint": "/v1/chat/completions",
+        "completion_window": "24h",
+    }
+
+    upload = files.uploads[-1]
+    assert upload["purpose"] == "batch"
+    lines = [json.loads(line) for line in upload["file"][1].decode("utf-8").splitlines()]
+    assert [line["custom_id"] for line in lines] == ["a", "b"]
+    assert lines[0]["url"] == "/v1/chat/completions"
+    assert lines[0]["body"]["max_tokens"] == 8
+    assert "max_tokens" not in lines[1]["body"]
+
+    assert client.poll(batch_id) == "in_progress"
+    with pytest.raises(RuntimeError):
+        client.results(batch_id)
+
+    batches.status = "completed"
+    ok = {"status_code": 200, "body": {"choices": [{"message": {"content": " hi "}}]}}
+    failed = {"status_code": 500, "body": {}}
+    files.contents["file-out"] = "\n".join(
+        [
+            json.dumps({"custom_id": "a", "response": ok, "error": None}),
+            json.dumps({"custom_id": "b", "response": failed, "error": None}),
+        ]
+    )
+    assert client.results(batch_id) == {"a": "hi"}
+
+
+def test_async_client_create_many_bounds_concurrency_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def stub_create(*, model, messages, top_p, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if messages[0]["content"] == "boom":
+            raise ValueError("boom")
+        return _StubResponse(f" {messages[0]['content']} ")
+
+    client = AsyncOpenAIChatCompletionClient(api_key="key", openai_create=stub_create, concurrency=2)
+    contents = ["a", "boom", "c", "d"]
+    results = client.create_many_sync(
+        ChatCompletionRequest(model_name="m", messages=[{"role": "user", "content": c}]) for c in contents
+    )
+
+    assert results[0] == "a"
+    assert isinstance(results[1], ValueError)
+    assert results[2:] == ["c", "d"]
+    assert peak == 2
+
+
+def test_create_uses_injected_http_client():
+    seen: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "id": "c1",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "m",
+                "choices": [
+                    {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": " pooled "}}
+                ],
+            },
+        )
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    client = OpenAIChatCompletionClient(api_key="key", http_client=http_client)
+
+    assert client.create(model_name="m", messages=[{"role": "user", "content": "x"}]) == "pooled"
+    assert seen[-1].url.path.endswith("/chat/completions")
+    assert json.loads(seen[-1].content)["model"] == "m"
+
+
+def test_async_client_create_many_sync_reuses_one_event_loop():
+    loops: List[asyncio.AbstractEventLoop] = []
+
+    async def stub_create(*, model, messages, top_p, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return _StubResponse("ok")
+
+    client = AsyncOpenAIChatCompletionClient(api_key="key", openai_create=stub_create)
+    request = ChatCompletionRequest(model_name="m", messages=[{"role": "user", "content": "x"}])
+
+    assert client.create_many_sync([request]) == ["ok"]
+    assert client.create_many_sync([request, request]) == ["ok", "ok"]
+    # Connections pooled by the first call are bound to its loop, so later calls must share it.
+    assert len(set(map(id, loops))) == 1
+
+    client.close()
+    assert loops[0].is_closed()
+
+
+def test_client_forwards_module_settings_and_closes_only_its_own_pool(monkeypatch):
+    monkeypatch.setattr(openai, "base_url", "http://proxy.local/v1/")
+    monkeypatch.setattr(openai, "max_retries", 7)
+
+    with OpenAIChatCompletionClient(api_key="key") as client:
+        assert client._client is not None
+        assert str(client._client.base_url) == "http://proxy.local/v1/"
+        assert client._client.max_retries == 7
+        pool = client._client._client
+    assert pool.is_closed
+
+    shared = httpx.Client()
+    with OpenAIChatCompletionClient(api_key="key", http_client=shared):
+        pass
+    assert not shared.is_closed
+    shared.close()
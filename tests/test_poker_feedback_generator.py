@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from beeflow_ai.generator.poker_feedback_generator import PokerFeedbackGenerator
+import pytest
+
+from beeflow_ai.generator.poker_feedback_generator import PokerFeedbackGenerator, _get_schema_validator
 from beeflow_ai.openai_chat_completition_client import ChatCompletionClient
 from beeflow_ai.prompt_builder import PokerFeedbackPromptBuilder, PokerStats
 
@@ -29,6 +31,24 @@ class StubClient(ChatCompletionClient):
         )
         return "x" * 100  # long content to test trimming
 
+    def create_stream(
+        self,
+        *,
+        model_name: str,
+        messages: list,
+        max_tokens: Optional[int] = None,
+        top_p: float = 1.0,
+    ) -> Iterator[str]:
+        self.calls.append({"model_name": model_name, "messages": messages, "stream": True})
+        self.closed = False
+        self.pulled = 0
+        try:
+            for piece in ["  ", " abc", "def", "ghijkl", "mnop"]:
+                self.pulled += 1
+                yield piece
+        finally:
+            self.closed = True
+
 
 def test_generate_builds_messages_passes_params_and_trims_output():
     stats: PokerStats = {"hands_played": 123}
@@ -52,3 +72,74 @@ def test_generate_builds_messages_passes_params_and_trims_output():
     assert "plain text only" in call["messages"][0]["content"]
     assert call["messages"][1]["role"] == "user"
     assert call["messages"][1]["content"].startswith("Provide concise poker coaching feedback")
+
+
+def test_generate_stream_trims_to_max_chars_and_closes_upstream_early():
+    client = StubClient()
+    gen = PokerFeedbackGenerator(
+        chat_completion_client=client,
+        model_name="gpt-X",
+        builder_factory=lambda s: PokerFeedbackPromptBuilder(s, max_chars=8),
+    )
+
+    pieces = list(gen.generate_stream({"hands_played": 1}))
+    assert pieces == ["abc", "def", "gh"]
+    assert client.closed is True
+    assert client.pulled == 4  # "mnop" was never requested
+    assert client.calls[-1]["stream"] is True
+    assert client.calls[-1]["messages"][0]["role"] == "system"
+
+
+def test_generate_strips_trailing_whitespace_at_the_trim_boundary():
+    class SpacedClient(StubClient):
+        def create(self, **kwargs) -> str:  # type: ignore[override]
+            return "abc def ghi"
+
+    gen = PokerFeedbackGenerator(
+        chat_completion_client=SpacedClient(),
+        builder_factory=lambda s: PokerFeedbackPromptBuilder(s, max_chars=4),
+    )
+    assert gen.generate({}) == "abc"
+
+
+def test_generators_share_one_compiled_schema_validator():
+    gen = PokerFeedbackGenerator(chat_completion_client=StubClient())
+    other = PokerFeedbackGenerator(chat_completion_client=StubClient())
+    assert gen.schema_validator is _get_schema_validator()
+    assert other.schema_validator is gen.schema_validator
+
+    assert gen.schema_validator.validate({"hands_played": 10, "vpip": 25.0, "leaks": ["Tilt"]})["ok"] is True
+    bad = gen.schema_validator.validate({"hands_played": -1, "vpip": 120, "net_profit_bb": -5})
+    assert bad["ok"] is False
+    assert len(bad["errors"]) == 2
+
+
+class ChunkedClient(StubClient):
+    def __init__(self, pieces: List[str]) -> None:
+        super().__init__()
+        self.pieces = pieces
+
+    def create(self, **kwargs) -> str:  # type: ignore[override]
+        return "".join(self.pieces)
+
+    def create_stream(self, **kwargs) -> Iterator[str]:  # type: ignore[override]
+        yield from self.pieces
+
+
+@pytest.mark.parametrize(
+    "pieces, max_chars",
+    [
+        (["abc   def"], 5),
+        (["abc ", "  ", "def"], 5),
+        (["abc", "  ", " def  "], 20),
+        (["  ab", "c ", "d e"], 5),
+        (["abcde", " fg"], 6),
+        (["   "], 5),
+    ],
+)
+def test_generate_stream_matches_generate_trimming(pieces, max_chars):
+    gen = PokerFeedbackGenerator(
+        chat_completion_client=ChunkedClient(pieces),
+        builder_factory=lambda s: PokerFeedbackPromptBuilder(s, max_chars=max_chars),
+    )
+    assert "".join(gen.generate_stream({})) == gen.generate({})
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from beeflow_ai.prompt_builder import PokerFeedbackPromptBuilder, PokerStats
+import dataclasses
+
+from beeflow_ai.prompt_builder import POKER_STATS_SCHEMA, PokerFeedbackPromptBuilder, PokerStats
 
 
 def test_build_includes_header_tone_and_stats_in_expected_format():
@@ -40,3 +42,35 @@ def test_build_includes_header_tone_and_stats_in_expected_format():
     assert "mins:75" in prompt
     assert "strengths:Value-betting; Discipline" in prompt
     assert "leaks:Calling 3-bets too wide" in prompt
+
+
+def test_cached_header_follows_field_assignments():
+    builder = PokerFeedbackPromptBuilder(stats={}, max_chars=280)
+    builder.max_chars = 100
+    builder.language_code = "en"
+    builder.tone = "direct"
+    builder.stats = {"hands_played": 7}
+
+    prompt = builder.build()
+    assert "max 100" in prompt
+    assert "Respond in en" in prompt
+    assert "Tone:direct, actionable" in prompt
+    assert "hands:7" in prompt
+
+    shorter = dataclasses.replace(builder, max_chars=50)
+    assert "max 50" in shorter.build()
+    assert "max 100" in builder.build()
+
+
+def test_stats_formatting_depends_on_value_type_not_key():
+    stats = {"vpip": 25, "pfr": None, "three_bet": "9", "hands_played": 12.25}
+    prompt = PokerFeedbackPromptBuilder(stats=stats).build()  # type: ignore[arg-type]
+
+    assert "vpip%:25 " in prompt
+    assert "pfr%:None" in prompt
+    assert "3bet%:9" in prompt
+    assert "hands:12.2" in prompt
+
+
+def test_poker_stats_schema_covers_exactly_the_typed_dict_keys():
+    assert set(POKER_STATS_SCHEMA["properties"]) == set(PokerStats.__annotations__)
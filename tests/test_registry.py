@@ -60,3 +60,19 @@ def test_register_content_generator_decorator_registers_by_model_name():
 
     gen_b = make_gen("model-b")
     assert ContentGeneratorRegistry.get("model-b") is gen_b
+
+
+def test_available_models_is_sorted_and_tracks_writes():
+    ContentGeneratorRegistry.clear()
+    ContentGeneratorRegistry.register(DummyGenerator(model_name="model-c"))
+    ContentGeneratorRegistry.register(DummyGenerator(model_name="model-a"))
+    ContentGeneratorRegistry.register(DummyGenerator(model_name="model-c"))
+
+    models = ContentGeneratorRegistry.available_models()
+    assert models == ["model-a", "model-c"]
+    # Callers get a copy; mutating it must not affect the registry.
+    models.append("model-z")
+    assert ContentGeneratorRegistry.available_models() == ["model-a", "model-c"]
+
+    ContentGeneratorRegistry.clear()
+    assert ContentGeneratorRegistry.available_models() == []